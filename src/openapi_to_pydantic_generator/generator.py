@@ -25,6 +25,7 @@ from .model_types import (
 from .naming import resolve_operations
 from .resolver import Resolver, SectionSchemas
 from .schema_to_models import SchemaConverter
+from .schema_utils import distinct_status_schemas
 from .verify import VerificationReport, verify_models
 from .writer import (
     WriteError,
@@ -255,16 +256,18 @@ def _append_status_sections(
     for section_name, root_class_name, schemas_by_status in status_sections:
         if not schemas_by_status:
             continue
+        status_schemas = distinct_status_schemas(schemas_by_status)
         section = converter.build_section_from_status_map(
             section_name=section_name,
             root_class_name=root_class_name,
             schemas_by_status=schemas_by_status,
+            status_schemas=status_schemas,
         )
         sections.append(section)
 
-        ordered_schemas = [schemas_by_status[key] for key in sorted(schemas_by_status)]
-        merged_source_schema: MutableJSONObject
-        if len(ordered_schemas) == 1:
+        ordered_schemas = [schema for _, schema in status_schemas]
+        merged_source_schema: JSONObject
+        if len(schemas_by_status) == 1:
             merged_source_schema = ordered_schemas[0]
         else:
             one_of_values: list[JSONValue] = list(ordered_schemas)
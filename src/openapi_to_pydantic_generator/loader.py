@@ -10,6 +10,9 @@ from pydantic import ValidationError
 
 from .json_types import JSONObject, JSONValue
 
+# libyaml parses large specs several times faster than the pure-Python loader.
+YamlLoader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
 
 class OpenAPILoadError(RuntimeError):
     """Raised when a source OpenAPI document cannot be loaded."""
@@ -25,8 +28,8 @@ def load_openapi_document(path: Path) -> JSONObject:
         JSONObject: Parsed and validated OpenAPI document.
     """
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle)
+        with path.open("rb") as handle:
+            payload = yaml.load(handle, Loader=YamlLoader)
     except OSError as exc:
         raise OpenAPILoadError(f"Failed to read OpenAPI file {path}: {exc}") from exc
     except yaml.YAMLError as exc:
@@ -8,7 +8,7 @@ from typing import Optional
 from .json_types import JSONValue, MutableJSONObject, JSONObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldDef:
     """Represents a single pydantic model field."""
 
@@ -20,7 +20,7 @@ class FieldDef:
     metadata: MutableJSONObject = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelSchemaConfig:
     """Schema and config metadata for a generated model class."""
 
@@ -31,7 +31,7 @@ class ModelSchemaConfig:
     additional_properties_annotation: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelDef:
     """Represents a generated pydantic model class."""
 
@@ -42,7 +42,7 @@ class ModelDef:
     config: ModelSchemaConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionModel:
     """A generated file section with its models and root class."""
 
@@ -51,7 +51,7 @@ class SectionModel:
     models: tuple[ModelDef, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionManifestEntry:
     """Manifest entry describing model usage for one generated section module."""
 
@@ -60,7 +60,7 @@ class SectionManifestEntry:
     model_names: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OperationManifestEntry:
     """Manifest entry describing generated section models for one HTTP method."""
 
@@ -71,7 +71,7 @@ class OperationManifestEntry:
     sections: tuple[SectionManifestEntry, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EndpointManifest:
     """Documentation payload for one generated endpoint package."""
 
@@ -80,7 +80,7 @@ class EndpointManifest:
     operations: tuple[OperationManifestEntry, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VerificationItem:
     """A model schema comparison entry."""
 
@@ -92,7 +92,7 @@ class VerificationItem:
     generated_module_path: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OperationSpec:
     """Normalized operation metadata extracted from OpenAPI paths."""
 
@@ -103,7 +103,7 @@ class OperationSpec:
     path_item: JSONObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenerationResult:
     """Generation output metadata."""
 
@@ -6,6 +6,7 @@ import keyword
 import re
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from .json_types import JSONObject, JSONValue
@@ -28,6 +29,7 @@ _MULTIPLE_UNDERSCORES_RE = re.compile(r"_+")
 _PATH_PARAM_RE = re.compile(r"^\{(?P<name>[^{}]+)\}$")
 
 
+@lru_cache(maxsize=4096)
 def sanitize_identifier(raw: str, *, lowercase: bool = True) -> str:
     """Convert arbitrary text into a valid Python identifier.
 
@@ -168,6 +170,7 @@ def resolve_operations(
     return resolved, warnings
 
 
+@lru_cache(maxsize=4096)
 def class_name(raw: str) -> str:
     """Convert a name to a PascalCase class name.
 
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 import json
 import re
 from dataclasses import dataclass
 from typing import Optional
 
 from .json_types import JSONMapping, JSONObject, JSONValue, MutableJSONObject
-from .schema_utils import merge_all_of_schema
+from .schema_utils import deep_copy, merge_all_of_schema
 
 _ORDER_INSENSITIVE_KEYS = {"required", "enum", "allOf", "anyOf", "oneOf"}
 _IGNORED_KEYS = {"$comment", "$ref", "format"}
@@ -33,7 +32,7 @@ def normalize_source_schema(schema: JSONObject) -> MutableJSONObject:
     Returns:
         MutableJSONObject: Normalized source schema.
     """
-    normalized: JSONValue = deepcopy(dict(schema))
+    normalized: JSONValue = deep_copy(dict(schema))
     normalized = _normalize_nullable(normalized)
     normalized = _normalize_all_of(normalized)
     return _as_dict(_normalize_structural(normalized))
@@ -48,7 +47,7 @@ def normalize_generated_schema(schema: JSONObject) -> MutableJSONObject:
     Returns:
         MutableJSONObject: Normalized generated schema.
     """
-    normalized: JSONValue = deepcopy(dict(schema))
+    normalized: JSONValue = deep_copy(dict(schema))
     normalized = _inline_local_refs(normalized)
     if isinstance(normalized, dict):
         normalized.pop("$defs", None)
@@ -476,13 +475,13 @@ def _resolve_ref_node(
         target = defs.get(key)
         if target is None:
             raise ValueError(f"Missing local schema definition for {ref}")
-        resolved = _resolve_ref_node(deepcopy(target), defs=defs, stack=(*stack, ref))
+        resolved = _resolve_ref_node(deep_copy(target), defs=defs, stack=(*stack, ref))
         siblings = {k: v for k, v in node.items() if k != "$ref"}
         if not siblings:
             return resolved
         if not isinstance(resolved, dict):
             return resolved
-        merged = deepcopy(resolved)
+        merged = deep_copy(resolved)
         for key_name, key_value in siblings.items():
             merged[key_name] = _resolve_ref_node(key_value, defs=defs, stack=stack)
         return merged
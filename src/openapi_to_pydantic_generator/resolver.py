@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import Optional
 
 from .json_types import JSONObject, JSONValue, MutableJSONObject
 from .model_types import OperationSpec
+from .schema_utils import deep_copy
 
 
 class ResolveError(RuntimeError):
@@ -40,7 +40,7 @@ class Resolver:
         Args:
             document (JSONObject): Loaded OpenAPI document.
         """
-        self._document = deepcopy(document)
+        self._document = deep_copy(dict(document))
         self._cache: dict[str, JSONValue] = {}
         self._cycle_cache: set[str] = set()
 
@@ -65,14 +65,11 @@ class Resolver:
         if isinstance(ref_value, str):
             resolved_ref = self._resolve_ref(ref_value, stack)
             siblings = {key: value for key, value in node.items() if key != "$ref"}
-            if siblings:
-                merged = deepcopy(resolved_ref)
-                if not isinstance(merged, dict):
-                    return merged
-                for key, value in siblings.items():
-                    merged[key] = self._resolve(value, stack)
-                return self._resolve(merged, stack)
-            return deepcopy(resolved_ref)
+            if not siblings or not isinstance(resolved_ref, dict):
+                return resolved_ref
+            for key, value in siblings.items():
+                resolved_ref[key] = self._resolve(value, stack)
+            return self._resolve(resolved_ref, stack)
 
         return {key: self._resolve(value, stack) for key, value in node.items()}
 
@@ -83,7 +80,7 @@ class Resolver:
             return {"$ref": ref}
 
         if ref in self._cache:
-            return deepcopy(self._cache[ref])
+            return deep_copy(self._cache[ref])
 
         if not ref.startswith("#/"):
             raise ResolveError(f"Only local references are currently supported: {ref}")
@@ -95,8 +92,8 @@ class Resolver:
                 raise ResolveError(f"Unresolvable reference: {ref}")
             current = current[token]
 
-        resolved = self._resolve(deepcopy(current), (*stack, ref))
-        self._cache[ref] = deepcopy(resolved)
+        resolved = self._resolve(deep_copy(current), (*stack, ref))
+        self._cache[ref] = deep_copy(resolved)
         return resolved
 
     def build_section_schemas(self, operation_spec: OperationSpec) -> SectionSchemas:
@@ -205,7 +202,7 @@ class Resolver:
                 "contentEncoding",
             ):
                 if doc_key in parameter and doc_key not in schema:
-                    schema[doc_key] = deepcopy(parameter[doc_key])
+                    schema[doc_key] = deep_copy(parameter[doc_key])
 
             properties[name] = schema
             if bool(parameter.get("required")):
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from copy import deepcopy
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Optional
 
 from pydantic import BaseModel, RootModel
@@ -12,53 +12,48 @@ from pydantic import BaseModel, RootModel
 from .json_types import JSONObject, JSONValue, MutableJSONObject
 from .model_types import FieldDef, ModelDef, ModelSchemaConfig, SectionModel
 from .naming import class_name, sanitize_identifier
-from .schema_utils import is_object_schema, merge_all_of_schema
+from .schema_utils import (
+    JSON_CONTAINER_CLASSES,
+    distinct_status_schemas,
+    is_object_schema,
+    merge_all_of_schema,
+)
 
 
-_DOC_FIELDS = {
-    "title",
-    "description",
-    "example",
-    "examples",
-    "deprecated",
-    "readOnly",
-    "writeOnly",
-    "xml",
-    "externalDocs",
-    "contentMediaType",
-    "contentEncoding",
-}
+_DOC_FIELDS = frozenset(
+    {
+        "title",
+        "description",
+        "example",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "xml",
+        "externalDocs",
+        "contentMediaType",
+        "contentEncoding",
+    }
+)
 
-_BASEMODEL_RESERVED = set(dir(BaseModel))
-_ROOTMODEL_RESERVED = set(dir(RootModel))
 _DEFAULT_PROTECTED_NAMESPACE_PREFIXES = ("model_dump", "model_validate")
-_PROTECTED_NAMESPACE_PREFIXES = tuple(
-    dict.fromkeys(
-        (
-            *_DEFAULT_PROTECTED_NAMESPACE_PREFIXES,
-            *(
-                namespace
-                for namespace in BaseModel.model_config.get("protected_namespaces", ())
-                if isinstance(namespace, str)
-            ),
-        )
-    )
+_BUILTIN_IDENTIFIER_RESERVED = frozenset(
+    {
+        "bool",
+        "bytes",
+        "complex",
+        "dict",
+        "float",
+        "frozenset",
+        "int",
+        "list",
+        "set",
+        "str",
+        "tuple",
+        "type",
+    }
 )
-_BUILTIN_IDENTIFIER_RESERVED = {
-    "bool",
-    "bytes",
-    "complex",
-    "dict",
-    "float",
-    "frozenset",
-    "int",
-    "list",
-    "set",
-    "str",
-    "tuple",
-    "type",
-}
-_RUFF_AMBIGUOUS_IDENTIFIER_NAMES = {"l", "o", "i"}
+_RUFF_AMBIGUOUS_IDENTIFIER_NAMES = frozenset({"l", "o", "i"})
 _JSON_VALUE_ANNOTATION = (
     "Optional[Union["
     "str, int, float, bool, "
@@ -67,50 +62,91 @@ _JSON_VALUE_ANNOTATION = (
     "]]"
 )
 _PYDANTIC_EXTRA_VALUE_ANNOTATION = _JSON_VALUE_ANNOTATION
-_FIELD_STRUCTURAL_KEYS = {
-    "$ref",
-    "type",
-    "properties",
-    "required",
-    "items",
-    "additionalProperties",
-    "allOf",
-    "anyOf",
-    "oneOf",
-    "discriminator",
-    "nullable",
-    "title",
-    "default",
-    "enum",
-    "const",
-}
-_MODEL_STRUCTURAL_KEYS = {
-    "$ref",
-    "type",
-    "properties",
-    "required",
-    "items",
-    "additionalProperties",
-    "allOf",
-    "anyOf",
-    "oneOf",
-    "discriminator",
-    "nullable",
-    "title",
-    "description",
-    "default",
-    "enum",
-    "const",
+_JSON_DICT_ANNOTATION = f"dict[str, {_JSON_VALUE_ANNOTATION}]"
+_PYDANTIC_EXTRA_DICT_ANNOTATION = f"dict[str, {_PYDANTIC_EXTRA_VALUE_ANNOTATION}]"
+_PRIMITIVE_TYPE_ANNOTATIONS = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "null": "None",
 }
+_FIELD_EXTRA_KEYS = (
+    "xml",
+    "externalDocs",
+    "contentMediaType",
+    "contentEncoding",
+    "readOnly",
+    "writeOnly",
+)
+_FIELD_DOC_KEYS = _DOC_FIELDS.difference(_FIELD_EXTRA_KEYS)
+_SCHEMA_EXTRA_KEYS = frozenset(
+    {
+        "xml",
+        "externalDocs",
+        "contentMediaType",
+        "contentEncoding",
+        "example",
+        "examples",
+        "readOnly",
+        "writeOnly",
+        "deprecated",
+    }
+)
+_FIELD_STRUCTURAL_KEYS = frozenset(
+    {
+        "$ref",
+        "type",
+        "properties",
+        "required",
+        "items",
+        "additionalProperties",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "discriminator",
+        "nullable",
+        "title",
+        "default",
+        "enum",
+        "const",
+    }
+)
+_MODEL_STRUCTURAL_KEYS = frozenset(
+    {
+        "$ref",
+        "type",
+        "properties",
+        "required",
+        "items",
+        "additionalProperties",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "discriminator",
+        "nullable",
+        "title",
+        "description",
+        "default",
+        "enum",
+        "const",
+    }
+)
 
+_FIELD_PASSTHROUGH_EXCLUDED_KEYS = _DOC_FIELDS | _FIELD_STRUCTURAL_KEYS
+_MODEL_PASSTHROUGH_EXCLUDED_KEYS = _DOC_FIELDS | _MODEL_STRUCTURAL_KEYS
 
-@dataclass
+
+@dataclass(slots=True)
 class _SectionContext:
     models: list[ModelDef] = field(default_factory=list)
     used_names: set[str] = field(default_factory=set)
+    object_models: dict[str, str] = field(default_factory=dict)
+    object_models_by_id: dict[int, tuple[JSONObject, str]] = field(default_factory=dict)
+    name_suffixes: dict[str, int] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _PropertySpec:
     source_name: str
     raw_schema: MutableJSONObject
@@ -126,7 +162,7 @@ class SchemaConverter:
         Args:
             openapi_version (str): Source OpenAPI version string.
         """
-        self._openapi_version = openapi_version
+        self._nullable_keyword = openapi_version.startswith("3.0")
 
     def build_section_from_schema(
         self,
@@ -146,9 +182,9 @@ class SchemaConverter:
             SectionModel: Section model set containing the root and nested models.
         """
         context = _SectionContext()
-        normalized_schema = self._normalize_nullable(deepcopy(dict(schema)))
+        normalized_schema = self._normalize_nullable(dict(schema))
 
-        if self._is_object_schema(normalized_schema):
+        if is_object_schema(normalized_schema):
             root_name = self._unique_name(class_name(root_class_name), context)
             self._build_object_model(
                 model_name=root_name,
@@ -177,25 +213,33 @@ class SchemaConverter:
         section_name: str,
         root_class_name: str,
         schemas_by_status: Mapping[str, JSONObject],
+        status_schemas: Optional[Sequence[tuple[str, JSONObject]]] = None,
     ) -> SectionModel:
         """Build models for sections keyed by HTTP status code.
 
+        Statuses sharing an identical schema are modeled once, under the first status.
+        Sections with several statuses always get a union root model, even when every
+        status shares one schema.
+
         Args:
             section_name (str): Logical section name (for example `response`).
             root_class_name (str): Desired root model class name.
             schemas_by_status (Mapping[str, JSONObject]): Schemas keyed by status code.
+            status_schemas (Optional[Sequence[tuple[str, JSONObject]]]): Result of
+                `distinct_status_schemas(schemas_by_status)` when the caller already
+                computed it; computed here otherwise.
 
         Returns:
             SectionModel: Section model set containing per-status and union models.
         """
         context = _SectionContext()
-        ordered_statuses = sorted(schemas_by_status)
+        if status_schemas is None:
+            status_schemas = distinct_status_schemas(schemas_by_status)
 
-        if len(ordered_statuses) == 1:
-            status = ordered_statuses[0]
-            schema = self._normalize_nullable(deepcopy(dict(schemas_by_status[status])))
+        if len(schemas_by_status) == 1:
+            schema = self._normalize_nullable(dict(status_schemas[0][1]))
             root_name = self._unique_name(class_name(root_class_name), context)
-            if self._is_object_schema(schema):
+            if is_object_schema(schema):
                 self._build_object_model(
                     model_name=root_name,
                     schema=schema,
@@ -213,14 +257,17 @@ class SchemaConverter:
                 models=tuple(context.models),
             )
 
+        # Statuses repeating an earlier schema get no class of their own, so a 400/500
+        # pair sharing one schema emits only Errors400 and the root is
+        # RootModel[Errors400]. Not emitting Errors500 is intentional.
         option_annotations: list[str] = []
-        for status in ordered_statuses:
-            schema = self._normalize_nullable(deepcopy(dict(schemas_by_status[status])))
+        for status, status_schema in status_schemas:
+            schema = self._normalize_nullable(dict(status_schema))
             status_model_name = self._unique_name(
                 class_name(f"{root_class_name}_{status}"),
                 context,
             )
-            if self._is_object_schema(schema):
+            if is_object_schema(schema):
                 self._build_object_model(
                     model_name=status_model_name,
                     schema=schema,
@@ -263,7 +310,7 @@ class SchemaConverter:
         self,
         *,
         model_name: str,
-        schema: MutableJSONObject,
+        schema: JSONObject,
         context: _SectionContext,
     ) -> str:
         merged = self._merge_all_of(schema)
@@ -313,7 +360,7 @@ class SchemaConverter:
         self,
         *,
         model_name: str,
-        schema: MutableJSONObject,
+        schema: JSONObject,
         context: _SectionContext,
     ) -> list[FieldDef]:
         properties = schema.get("properties")
@@ -327,7 +374,7 @@ class SchemaConverter:
             else set()
         )
         fields: list[FieldDef] = []
-        used_field_names: set[str] = set()
+        used_field_names: dict[str, int] = {}
         for source_name, raw_prop in properties.items():
             if not isinstance(source_name, str) or not isinstance(raw_prop, dict):
                 continue
@@ -352,11 +399,10 @@ class SchemaConverter:
         model_name: str,
         prop: _PropertySpec,
         context: _SectionContext,
-        used_field_names: set[str],
+        used_field_names: dict[str, int],
     ) -> Optional[FieldDef]:
-        prop_schema = self._normalize_nullable(deepcopy(prop.raw_schema))
+        prop_schema = self._normalize_nullable(prop.raw_schema)
         field_name = self._field_name(prop.source_name, used_field_names)
-        used_field_names.add(field_name)
         annotation = self._schema_to_annotation(
             schema=prop_schema,
             hint=f"{model_name}_{prop.source_name}",
@@ -392,7 +438,7 @@ class SchemaConverter:
         additional_properties = schema.get("additionalProperties")
         additional_properties_annotation: Optional[str] = None
         if isinstance(additional_properties, dict):
-            additional_properties_annotation = f"dict[str, {_PYDANTIC_EXTRA_VALUE_ANNOTATION}]"
+            additional_properties_annotation = _PYDANTIC_EXTRA_DICT_ANNOTATION
 
         if additional_properties is False:
             extra_behavior = "forbid"
@@ -401,9 +447,7 @@ class SchemaConverter:
 
         schema_extra = self._schema_extra(schema)
         if isinstance(additional_properties, dict):
-            schema_extra["additionalProperties"] = sanitize_json_schema_extra(
-                deepcopy(additional_properties)
-            )
+            schema_extra["additionalProperties"] = sanitize_json_schema_extra(additional_properties)
 
         return ModelSchemaConfig(
             docstring=self._string_or_none(schema.get("description")),
@@ -414,53 +458,48 @@ class SchemaConverter:
         )
 
     @staticmethod
-    def _field_name(source_name: str, used_names: set[str]) -> str:
+    def _field_name(source_name: str, used_names: dict[str, int]) -> str:
+        # `used_names` maps each claimed name to the next numeric suffix to try when
+        # another field sanitizes to the same candidate.
         candidate = sanitize_identifier(source_name)
         if _has_protected_namespace_prefix(candidate):
             candidate = f"field_{candidate}"
         while _is_reserved_field_name(candidate) or _has_protected_namespace_prefix(candidate):
             candidate = f"{candidate}_"
         if candidate not in used_names:
+            used_names[candidate] = 2
             return candidate
 
-        suffix = 2
+        suffix = used_names[candidate]
+        numbered = f"{candidate}{suffix}"
         while (
-            f"{candidate}{suffix}" in used_names
-            or _is_reserved_field_name(f"{candidate}{suffix}")
-            or _has_protected_namespace_prefix(f"{candidate}{suffix}")
+            numbered in used_names
+            or _is_reserved_field_name(numbered)
+            or _has_protected_namespace_prefix(numbered)
         ):
             suffix += 1
-        return f"{candidate}{suffix}"
+            numbered = f"{candidate}{suffix}"
+        used_names[candidate] = suffix + 1
+        used_names[numbered] = 2
+        return numbered
 
     def _field_metadata(self, schema: JSONObject) -> MutableJSONObject:
         metadata: MutableJSONObject = {}
-        for key in _DOC_FIELDS:
-            if key in schema:
-                metadata[key] = deepcopy(schema[key])
-
-        extra: MutableJSONObject = {}
-        for key in (
-            "xml",
-            "externalDocs",
-            "contentMediaType",
-            "contentEncoding",
-            "readOnly",
-            "writeOnly",
-        ):
-            if key in metadata:
-                extra[key] = metadata.pop(key)
-
-        passthrough = self._passthrough_schema_extra(
-            schema=schema,
-            structural_keys=_FIELD_STRUCTURAL_KEYS,
-        )
+        passthrough: MutableJSONObject = {}
+        for key, value in schema.items():
+            if key in _FIELD_DOC_KEYS:
+                metadata[key] = value
+            elif key not in _FIELD_PASSTHROUGH_EXCLUDED_KEYS:
+                passthrough[key] = sanitize_json_schema_extra(value)
+        extra: MutableJSONObject = {key: schema[key] for key in _FIELD_EXTRA_KEYS if key in schema}
         extra.update(passthrough)
-        if isinstance(schema.get("items"), dict):
-            extra["items"] = sanitize_json_schema_extra(deepcopy(schema["items"]))
-        if isinstance(schema.get("additionalProperties"), dict):
-            extra["additionalProperties"] = sanitize_json_schema_extra(
-                deepcopy(schema["additionalProperties"])
-            )
+
+        items = schema.get("items")
+        if isinstance(items, dict):
+            extra["items"] = sanitize_json_schema_extra(items)
+        additional_properties = schema.get("additionalProperties")
+        if isinstance(additional_properties, dict):
+            extra["additionalProperties"] = sanitize_json_schema_extra(additional_properties)
 
         if extra:
             metadata["json_schema_extra"] = extra
@@ -468,41 +507,14 @@ class SchemaConverter:
 
     def _schema_extra(self, schema: JSONObject) -> MutableJSONObject:
         extra: MutableJSONObject = {}
-        for key in (
-            "xml",
-            "externalDocs",
-            "contentMediaType",
-            "contentEncoding",
-            "example",
-            "examples",
-            "readOnly",
-            "writeOnly",
-            "deprecated",
-        ):
-            if key in schema:
-                extra[key] = sanitize_json_schema_extra(deepcopy(schema[key]))
-
-        passthrough = self._passthrough_schema_extra(
-            schema=schema,
-            structural_keys=_MODEL_STRUCTURAL_KEYS,
-        )
-        extra.update(passthrough)
-        return extra
-
-    @staticmethod
-    def _passthrough_schema_extra(
-        *,
-        schema: JSONObject,
-        structural_keys: set[str],
-    ) -> MutableJSONObject:
         passthrough: MutableJSONObject = {}
         for key, value in schema.items():
-            if key in _DOC_FIELDS:
-                continue
-            if key in structural_keys:
-                continue
-            passthrough[key] = sanitize_json_schema_extra(deepcopy(value))
-        return passthrough
+            if key in _SCHEMA_EXTRA_KEYS:
+                extra[key] = sanitize_json_schema_extra(value)
+            elif key not in _MODEL_PASSTHROUGH_EXCLUDED_KEYS:
+                passthrough[key] = sanitize_json_schema_extra(value)
+        extra.update(passthrough)
+        return extra
 
     def _schema_to_annotation(
         self,
@@ -526,19 +538,12 @@ class SchemaConverter:
         schema_type = schema.get("type")
         if schema_type == "array":
             annotation = self._annotation_for_array(schema=schema, hint=hint, context=context)
-        elif schema_type == "object" or self._is_object_schema(schema):
+        elif schema_type == "object" or is_object_schema(schema):
             annotation = self._annotation_for_object(schema=schema, hint=hint, context=context)
         else:
-            primitive_map = {
-                "string": "str",
-                "integer": "int",
-                "number": "float",
-                "boolean": "bool",
-                "null": "None",
-            }
             annotation = (
-                primitive_map[schema_type]
-                if isinstance(schema_type, str) and schema_type in primitive_map
+                _PRIMITIVE_TYPE_ANNOTATIONS.get(schema_type, _JSON_VALUE_ANNOTATION)
+                if isinstance(schema_type, str)
                 else _JSON_VALUE_ANNOTATION
             )
         return annotation
@@ -560,8 +565,7 @@ class SchemaConverter:
             if member == "null":
                 members.append("None")
                 continue
-            member_schema = deepcopy(dict(schema))
-            member_schema["type"] = member
+            member_schema: MutableJSONObject = {**schema, "type": member}
             members.append(
                 self._schema_to_annotation(
                     schema=member_schema,
@@ -577,8 +581,7 @@ class SchemaConverter:
             return f"Literal[{safe_literal(schema['const'])}]"
         enum = schema.get("enum")
         if isinstance(enum, list) and enum:
-            literals = ", ".join(safe_literal(value) for value in enum)
-            return f"Literal[{literals}]"
+            return f"Literal[{safe_literal_members(enum)}]"
         return None
 
     def _annotation_from_combinators(
@@ -612,14 +615,8 @@ class SchemaConverter:
         all_of = schema.get("allOf")
         if isinstance(all_of, list) and all_of:
             merged = self._merge_all_of(schema)
-            if self._is_object_schema(merged):
-                nested_name = self._unique_name(class_name(hint), context)
-                self._build_object_model(
-                    model_name=nested_name,
-                    schema=merged,
-                    context=context,
-                )
-                return nested_name
+            if is_object_schema(merged):
+                return self._nested_object_model(hint=hint, schema=merged, context=context)
             return self._union_from_schema_list(
                 schemas=all_of,
                 hint_prefix=f"{hint}All",
@@ -636,7 +633,7 @@ class SchemaConverter:
     ) -> str:
         options: list[str] = []
         for index, item in enumerate(schemas):
-            item_schema = self._normalize_nullable(deepcopy(item)) if isinstance(item, dict) else {}
+            item_schema = self._normalize_nullable(item) if isinstance(item, dict) else {}
             options.append(
                 self._schema_to_annotation(
                     schema=item_schema,
@@ -678,12 +675,12 @@ class SchemaConverter:
         items = schema.get("items")
         item_schema: MutableJSONObject
         if isinstance(items, dict):
-            item_schema = deepcopy(items)
+            item_schema = items
         else:
             item_schema = {}
             properties = schema.get("properties")
             if isinstance(properties, dict):
-                item_schema = {"type": "object", "properties": deepcopy(properties)}
+                item_schema = {"type": "object", "properties": properties}
                 required = schema.get("required")
                 if isinstance(required, list):
                     item_schema["required"] = _to_json_value_list(
@@ -691,7 +688,7 @@ class SchemaConverter:
                     )
 
         item_annotation = self._schema_to_annotation(
-            schema=self._normalize_nullable(deepcopy(item_schema)),
+            schema=self._normalize_nullable(item_schema),
             hint=f"{hint}Item",
             context=context,
         )
@@ -711,60 +708,74 @@ class SchemaConverter:
     ) -> str:
         properties = schema.get("properties")
         if isinstance(properties, dict):
-            nested_name = self._unique_name(class_name(hint), context)
-            self._build_object_model(
-                model_name=nested_name,
-                schema=deepcopy(dict(schema)),
+            return self._nested_object_model(
+                hint=hint,
+                schema=schema,
                 context=context,
             )
-            return nested_name
 
         additional = schema.get("additionalProperties")
         if isinstance(additional, dict):
             value_annotation = self._schema_to_annotation(
-                schema=self._normalize_nullable(deepcopy(additional)),
+                schema=self._normalize_nullable(additional),
                 hint=f"{hint}Additional",
                 context=context,
             )
             return f"dict[str, {value_annotation}]"
         if additional is False:
-            nested_name = self._unique_name(class_name(hint), context)
-            self._build_object_model(
-                model_name=nested_name,
+            return self._nested_object_model(
+                hint=hint,
                 schema={"type": "object", "properties": {}, "additionalProperties": False},
                 context=context,
             )
-            return nested_name
-        return f"dict[str, {_JSON_VALUE_ANNOTATION}]"
+        return _JSON_DICT_ANNOTATION
+
+    def _nested_object_model(
+        self,
+        *,
+        hint: str,
+        schema: JSONObject,
+        context: _SectionContext,
+    ) -> str:
+        # Inlined `$ref` targets repeat the same object shape many times within a
+        # section; build it once and reuse the class. The class is named after the
+        # hint of the first use site, and later sites with the same shape reuse that
+        # name. Resolved `$ref` targets are shared node objects, so most repeats are
+        # found by identity without `repr`ing the subtree again; the entry keeps the
+        # node alive so its `id` cannot be reused. `repr` keeps `1`/`True`/`1.0`
+        # apart, which `==` on the schema would not.
+        identity_match = context.object_models_by_id.get(id(schema))
+        if identity_match is not None:
+            return identity_match[1]
+        shape_key = repr(schema)
+        nested_name = context.object_models.get(shape_key)
+        if nested_name is None:
+            nested_name = self._unique_name(class_name(hint), context)
+            self._build_object_model(model_name=nested_name, schema=schema, context=context)
+            context.object_models[shape_key] = nested_name
+        context.object_models_by_id[id(schema)] = (schema, nested_name)
+        return nested_name
 
     @staticmethod
     def _make_union(annotations: list[str]) -> str:
-        deduped: list[str] = []
-        for annotation in annotations:
-            if annotation not in deduped:
-                deduped.append(annotation)
+        deduped = list(dict.fromkeys(annotations))
         if not deduped:
             return _JSON_VALUE_ANNOTATION
         if len(deduped) == 1:
             return deduped[0]
-        nullable = "None" in deduped
         members = [annotation for annotation in deduped if annotation != "None"]
-        if nullable and len(members) == 1:
+        if len(members) == len(deduped):
+            return f"Union[{', '.join(deduped)}]"
+        if len(members) == 1:
             return f"Optional[{members[0]}]"
-        if nullable and len(members) > 1:
-            return f"Optional[Union[{', '.join(members)}]]"
-        return f"Union[{', '.join(deduped)}]"
+        return f"Optional[Union[{', '.join(members)}]]"
 
-    def _merge_all_of(self, schema: JSONObject) -> MutableJSONObject:
+    def _merge_all_of(self, schema: JSONObject) -> JSONObject:
         return merge_all_of_schema(
             schema,
             normalize_item=self._normalize_nullable,
         )
 
-    @staticmethod
-    def _is_object_schema(schema: JSONObject) -> bool:
-        return is_object_schema(schema)
-
     @staticmethod
     def _is_discriminator_compatible(
         one_of: list[JSONValue],
@@ -779,27 +790,25 @@ class SchemaConverter:
             discriminator_schema = props.get(property_name)
             if not isinstance(discriminator_schema, dict):
                 return False
-            const_value = discriminator_schema.get("const")
-            enum_value = discriminator_schema.get("enum")
-            if const_value is not None:
-                continue
-            if isinstance(enum_value, list) and len(enum_value) == 1:
+            if discriminator_schema.get("const") is not None:
                 continue
-            return False
+            enum_value = discriminator_schema.get("enum")
+            if not isinstance(enum_value, list) or len(enum_value) != 1:
+                return False
         return True
 
     def _normalize_nullable(self, schema: MutableJSONObject) -> MutableJSONObject:
-        if self._openapi_version.startswith("3.0") and schema.get("nullable") is True:
-            schema = deepcopy(schema)
+        if self._nullable_keyword and schema.get("nullable") is True:
+            schema = dict(schema)
             schema.pop("nullable", None)
             schema_type = schema.get("type")
             if isinstance(schema_type, str):
                 schema["type"] = _to_json_value_list([schema_type, "null"])
             elif isinstance(schema_type, list):
                 if "null" not in schema_type:
-                    schema_type.append("null")
+                    schema["type"] = [*schema_type, "null"]
             else:
-                original = deepcopy(schema)
+                original = dict(schema)
                 schema.clear()
                 schema["anyOf"] = [original, {"type": "null"}]
         return schema
@@ -809,11 +818,12 @@ class SchemaConverter:
         if base_name not in context.used_names:
             context.used_names.add(base_name)
             return base_name
-        suffix = 2
+        suffix = context.name_suffixes.get(base_name, 2)
         while f"{base_name}{suffix}" in context.used_names:
             suffix += 1
         name = f"{base_name}{suffix}"
         context.used_names.add(name)
+        context.name_suffixes[base_name] = suffix + 1
         return name
 
     @staticmethod
@@ -833,24 +843,63 @@ def safe_literal(value: JSONValue) -> str:
     return repr(value)
 
 
+def safe_literal_members(values: list[JSONValue]) -> str:
+    """Return comma-separated literal representations of several values.
+
+    The members are rendered with a single `repr` of the whole list, which matches
+    joining `safe_literal` of each member without a Python-level call per value.
+
+    Args:
+        values (list[JSONValue]): Values to represent, in order.
+
+    Returns:
+        str: Literal strings joined by `", "`, without enclosing brackets.
+    """
+    return repr(values)[1:-1]
+
+
 def sanitize_json_schema_extra(value: JSONValue) -> JSONValue:
     """Drop external refs in schema metadata payloads.
 
+    The input is never aliased into the result: containers are always rebuilt, so
+    callers do not need to copy the value beforehand.
+
     Args:
         value (JSONValue): Raw JSON-schema metadata value.
 
     Returns:
         JSONValue: Sanitized metadata value without unsupported `$ref` entries.
     """
+    sanitized = _empty_container_like(value)
+    pending: list[tuple[JSONValue, JSONValue]] = [(value, sanitized)]
+    while pending:
+        source, target = pending.pop()
+        if isinstance(source, dict) and isinstance(target, dict):
+            for key, item in source.items():
+                if key == "$ref":
+                    continue
+                if isinstance(item, JSON_CONTAINER_CLASSES):
+                    child = _empty_container_like(item)
+                    pending.append((item, child))
+                    target[key] = child
+                else:
+                    target[key] = item
+        elif isinstance(source, list) and isinstance(target, list):
+            for item in source:
+                if isinstance(item, JSON_CONTAINER_CLASSES):
+                    child = _empty_container_like(item)
+                    pending.append((item, child))
+                    target.append(child)
+                else:
+                    target.append(item)
+    return sanitized
+
+
+def _empty_container_like(value: JSONValue) -> JSONValue:
     if isinstance(value, dict):
-        sanitized: MutableJSONObject = {}
-        for key, item in value.items():
-            if key == "$ref":
-                continue
-            sanitized[key] = sanitize_json_schema_extra(item)
-        return sanitized
+        return {}
     if isinstance(value, list):
-        return [sanitize_json_schema_extra(item) for item in value]
+        return []
     return value
 
 
@@ -859,13 +908,36 @@ def _to_json_value_list(values: list[str]) -> list[JSONValue]:
 
 
 def _is_reserved_field_name(candidate: str) -> bool:
-    return (
-        candidate in _BASEMODEL_RESERVED
-        or candidate in _ROOTMODEL_RESERVED
-        or candidate in _BUILTIN_IDENTIFIER_RESERVED
-        or candidate in _RUFF_AMBIGUOUS_IDENTIFIER_NAMES
-    )
+    return candidate in _reserved_field_names()
 
 
 def _has_protected_namespace_prefix(candidate: str) -> bool:
-    return any(candidate.startswith(prefix) for prefix in _PROTECTED_NAMESPACE_PREFIXES)
+    return candidate.startswith(_protected_namespace_prefixes())
+
+
+@cache
+def _reserved_field_names() -> frozenset[str]:
+    return frozenset(
+        (
+            *dir(BaseModel),
+            *dir(RootModel),
+            *_BUILTIN_IDENTIFIER_RESERVED,
+            *_RUFF_AMBIGUOUS_IDENTIFIER_NAMES,
+        )
+    )
+
+
+@cache
+def _protected_namespace_prefixes() -> tuple[str, ...]:
+    return tuple(
+        dict.fromkeys(
+            (
+                *_DEFAULT_PROTECTED_NAMESPACE_PREFIXES,
+                *(
+                    namespace
+                    for namespace in BaseModel.model_config.get("protected_namespaces", ())
+                    if isinstance(namespace, str)
+                ),
+            )
+        )
+    )
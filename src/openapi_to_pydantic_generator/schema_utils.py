@@ -2,12 +2,50 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from copy import deepcopy
-from typing import Optional
+from collections.abc import Callable, Mapping
+from typing import Optional, overload
 
 from .json_types import JSONObject, JSONValue, MutableJSONObject
 
+JSON_CONTAINER_CLASSES = (dict, list)
+
+
+@overload
+def deep_copy(value: MutableJSONObject) -> MutableJSONObject: ...
+
+
+@overload
+def deep_copy(value: list[JSONValue]) -> list[JSONValue]: ...
+
+
+@overload
+def deep_copy(value: JSONValue) -> JSONValue: ...
+
+
+def deep_copy(value: JSONValue) -> JSONValue:
+    """Return a deep copy of a JSON-like value.
+
+    Unlike `copy.deepcopy`, this only descends into dicts and lists and skips memo
+    bookkeeping, which keeps cloning cheap on large resolved schema trees. Immutable
+    scalar members are shared with the input.
+
+    Args:
+        value (JSONValue): Value to copy.
+
+    Returns:
+        JSONValue: Copy sharing no mutable containers with the input.
+    """
+    if isinstance(value, dict):
+        return {
+            key: deep_copy(item) if isinstance(item, JSON_CONTAINER_CLASSES) else item
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [
+            deep_copy(item) if isinstance(item, JSON_CONTAINER_CLASSES) else item for item in value
+        ]
+    return value
+
 
 def is_object_schema(schema: JSONObject) -> bool:
     """Return whether a schema behaves as an object schema.
@@ -31,29 +69,60 @@ def is_object_schema(schema: JSONObject) -> bool:
     return False
 
 
+def distinct_status_schemas(
+    schemas_by_status: Mapping[str, JSONObject],
+) -> list[tuple[str, JSONObject]]:
+    """Return status/schema pairs in status order, skipping repeated schemas.
+
+    Statuses whose schema repeats one already seen (for example `200` and `201`
+    returning the same body) are dropped so they share the earlier status model.
+    Schemas are compared by `repr`, because `==` treats `1`, `1.0` and `True` as
+    equal and would merge statuses accepting different enum values.
+
+    Args:
+        schemas_by_status (Mapping[str, JSONObject]): Schemas keyed by status code.
+
+    Returns:
+        list[tuple[str, JSONObject]]: First status and schema for each distinct schema.
+    """
+    distinct: list[tuple[str, JSONObject]] = []
+    seen_keys: set[str] = set()
+    for status in sorted(schemas_by_status):
+        schema = schemas_by_status[status]
+        schema_key = repr(schema)
+        if schema_key not in seen_keys:
+            seen_keys.add(schema_key)
+            distinct.append((status, schema))
+    return distinct
+
+
 def merge_all_of_schema(
     schema: JSONObject,
     *,
     normalize_item: Optional[Callable[[MutableJSONObject], MutableJSONObject]] = None,
-) -> MutableJSONObject:
+) -> JSONObject:
     """Merge object-only `allOf` chains into one object schema when possible.
 
+    When there is nothing to merge the input schema itself is returned, so callers
+    must treat the result as read-only.
+
     Args:
         schema (JSONObject): Schema that may contain an `allOf` chain.
         normalize_item (Optional[Callable[[MutableJSONObject], MutableJSONObject]]):
             Optional normalization callback applied to each child before merge.
 
     Returns:
-        MutableJSONObject: Merged object schema, or the original schema shape.
+        JSONObject: Merged object schema, or the original schema.
     """
     all_of = schema.get("allOf")
     if not isinstance(all_of, list) or not all_of:
-        return deepcopy(dict(schema))
+        return schema
 
-    merged: MutableJSONObject = {key: value for key, value in schema.items() if key != "allOf"}
     child_schemas = _collect_mergeable_all_of_children(all_of, normalize_item=normalize_item)
     if child_schemas is None:
-        return deepcopy(dict(schema))
+        return schema
+
+    merged: MutableJSONObject = {key: value for key, value in schema.items() if key != "allOf"}
 
     merged_properties: MutableJSONObject = {}
     merged_required: set[str] = set()
@@ -81,14 +150,12 @@ def _collect_mergeable_all_of_children(
     all_of: list[JSONValue],
     *,
     normalize_item: Optional[Callable[[MutableJSONObject], MutableJSONObject]],
-) -> Optional[list[MutableJSONObject]]:
-    children: list[MutableJSONObject] = []
+) -> Optional[list[JSONObject]]:
+    children: list[JSONObject] = []
     for item in all_of:
         if not isinstance(item, dict):
             return None
-        child_schema = deepcopy(item)
-        if normalize_item is not None:
-            child_schema = normalize_item(child_schema)
+        child_schema = item if normalize_item is None else normalize_item(item)
         merged_child = merge_all_of_schema(child_schema, normalize_item=normalize_item)
         if not is_object_schema(merged_child):
             return None
@@ -104,7 +171,7 @@ def _merge_child_object_data(
 ) -> None:
     child_properties = child_schema.get("properties")
     if isinstance(child_properties, dict):
-        merged_properties.update(deepcopy(child_properties))
+        merged_properties.update(child_properties)
 
     child_required = child_schema.get("required")
     if isinstance(child_required, list):
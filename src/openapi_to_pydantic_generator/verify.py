@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import itertools
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from types import ModuleType
@@ -11,7 +12,7 @@ from jsonschema.exceptions import SchemaError
 from jsonschema.validators import validator_for
 from pydantic import BaseModel
 
-from .json_types import JSONValue
+from .json_types import JSONValue, MutableJSONObject
 from .module_loading import load_module_from_path
 from .model_types import VerificationItem
 from .normalize import (
@@ -59,6 +60,7 @@ def verify_models(
         VerificationReport: Aggregate verification report with mismatch details.
     """
     mismatches: list[VerificationMismatch] = []
+    checked_schemas: set[str] = set()
 
     for item in items:
         source_normalized = normalize_source_schema(item.source_schema)
@@ -75,14 +77,8 @@ def verify_models(
         generated_normalized = normalize_generated_schema(generated_schema_value)
 
         # Validate generated schema shape. Source schemas can carry OpenAPI-specific forms.
-        try:
-            validator_for(source_normalized).check_schema(source_normalized)
-        except SchemaError:
-            pass
-        try:
-            validator_for(generated_normalized).check_schema(generated_normalized)
-        except SchemaError:
-            pass
+        _check_schema_once(source_normalized, checked_schemas=checked_schemas)
+        _check_schema_once(generated_normalized, checked_schemas=checked_schemas)
 
         mismatch = subset_mismatch(source_normalized, generated_normalized)
         if mismatch is not None:
@@ -133,7 +129,9 @@ def _load_model_class(*, module_path: Path, class_name: str) -> type[BaseModel]:
     if not module_path.exists():
         raise RuntimeError(f"Generated module not found: {module_path}")
 
-    module_name = f"generated_{abs(hash(str(module_path)))}_{next(_COUNTER)}"
+    module_name = f"_openapi_to_pydantic_verify_{next(_COUNTER)}"
+    while module_name in sys.modules:
+        module_name = f"_openapi_to_pydantic_verify_{next(_COUNTER)}"
     module = load_module_from_path(module_name=module_name, module_path=module_path)
     _rebuild_module_models(module=module)
 
@@ -143,6 +141,19 @@ def _load_model_class(*, module_path: Path, class_name: str) -> type[BaseModel]:
     return value
 
 
+def _check_schema_once(schema: MutableJSONObject, *, checked_schemas: set[str]) -> None:
+    # Meta-validation dominates verification time and its outcome depends only on the
+    # schema itself, so identical normalized schemas are checked once per run.
+    schema_key = repr(schema)
+    if schema_key in checked_schemas:
+        return
+    checked_schemas.add(schema_key)
+    try:
+        validator_for(schema).check_schema(schema)
+    except SchemaError:
+        pass
+
+
 def _to_mismatch(*, item: VerificationItem, mismatch: Mismatch) -> VerificationMismatch:
     return VerificationMismatch(
         endpoint_name=item.endpoint_name,
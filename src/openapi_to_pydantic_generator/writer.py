@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 import subprocess
-import sys
+
+from ruff.__main__ import find_ruff_bin
 
 from .codegen_ast import (
     render_endpoint_init_module,
@@ -63,9 +64,7 @@ def write_operation_sections(
         method (str): HTTP method name.
         sections (list[SectionModel]): Section models to render and write.
     """
-    endpoint_dir = models_dir / endpoint_name
-    method_dir = endpoint_dir / method
-    endpoint_dir.mkdir(parents=True, exist_ok=True)
+    method_dir = models_dir / endpoint_name / method
     method_dir.mkdir(parents=True, exist_ok=True)
 
     _write_file(
@@ -124,11 +123,10 @@ def format_generated_tree(*, models_dir: Path) -> None:
 
 
 def _run_ruff(*, models_dir: Path, args: tuple[str, ...]) -> None:
-    command = [sys.executable, "-m", "ruff", *args]
     command_desc = " ".join(args)
     try:
         subprocess.run(
-            command,
+            [find_ruff_bin(), *args],
             check=True,
             capture_output=True,
             text=True,
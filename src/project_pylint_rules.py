@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from itertools import chain
 
 from astroid import nodes
 from pylint.checkers import BaseChecker
@@ -81,59 +82,39 @@ class ProjectRulesChecker(BaseChecker):
         self._check_annotation(node.value)
 
     def _check_annotation(self, annotation: nodes.NodeNG) -> None:
-        for optional_union in self._iter_optional_pipe_unions(annotation):
-            self.add_message(_MESSAGE_PREFER_OPTIONAL, node=optional_union)
-        for union_pipe in self._iter_union_pipe_annotations(annotation):
-            self.add_message(_MESSAGE_PREFER_UNION, node=union_pipe)
-        for object_name in self._iter_object_annotations(annotation):
-            self.add_message(_MESSAGE_NO_OBJECT_ANNOTATION, node=object_name)
+        for candidate in annotation.nodes_of_class((nodes.BinOp, nodes.Name)):
+            if isinstance(candidate, nodes.Name):
+                if candidate.name == "object":
+                    self.add_message(_MESSAGE_NO_OBJECT_ANNOTATION, node=candidate)
+                continue
+            if candidate.op != "|":
+                continue
+            if _is_optional_pipe(candidate):
+                self.add_message(_MESSAGE_PREFER_OPTIONAL, node=candidate)
+            elif not _is_nested_union_pipe(candidate):
+                self.add_message(_MESSAGE_PREFER_UNION, node=candidate)
 
     @staticmethod
     def _iter_argument_annotations(arguments: nodes.Arguments) -> Iterable[nodes.NodeNG]:
-        for annotation in arguments.posonlyargs_annotations:
-            if annotation is not None:
-                yield annotation
-        for annotation in arguments.annotations:
-            if annotation is not None:
-                yield annotation
-        for annotation in arguments.kwonlyargs_annotations:
-            if annotation is not None:
-                yield annotation
-        if arguments.varargannotation is not None:
-            yield arguments.varargannotation
-        if arguments.kwargannotation is not None:
-            yield arguments.kwargannotation
+        return filter(
+            None,
+            chain(
+                arguments.posonlyargs_annotations,
+                arguments.annotations,
+                arguments.kwonlyargs_annotations,
+                (arguments.varargannotation, arguments.kwargannotation),
+            ),
+        )
 
-    @staticmethod
-    def _iter_optional_pipe_unions(annotation: nodes.NodeNG) -> Iterable[nodes.BinOp]:
-        for candidate in annotation.nodes_of_class(nodes.BinOp):
-            if candidate.op != "|":
-                continue
-            if _is_none_literal(candidate.left) or _is_none_literal(candidate.right):
-                yield candidate
 
-    @staticmethod
-    def _iter_union_pipe_annotations(annotation: nodes.NodeNG) -> Iterable[nodes.BinOp]:
-        for candidate in annotation.nodes_of_class(nodes.BinOp):
-            if candidate.op != "|":
-                continue
-            if _is_none_literal(candidate.left) or _is_none_literal(candidate.right):
-                continue
+def _is_optional_pipe(node: nodes.BinOp) -> bool:
+    return _is_none_literal(node.left) or _is_none_literal(node.right)
 
-            parent = candidate.parent
-            if (
-                isinstance(parent, nodes.BinOp)
-                and parent.op == "|"
-                and not (_is_none_literal(parent.left) or _is_none_literal(parent.right))
-            ):
-                continue
-            yield candidate
 
-    @staticmethod
-    def _iter_object_annotations(annotation: nodes.NodeNG) -> Iterable[nodes.Name]:
-        for candidate in annotation.nodes_of_class(nodes.Name):
-            if candidate.name == "object":
-                yield candidate
+def _is_nested_union_pipe(node: nodes.BinOp) -> bool:
+    # Only the outermost ``|`` of a chain such as ``A | B | C`` is reported.
+    parent = node.parent
+    return isinstance(parent, nodes.BinOp) and parent.op == "|" and not _is_optional_pipe(parent)
 
 
 def _is_none_literal(node: nodes.NodeNG) -> bool:
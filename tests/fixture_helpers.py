@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 from typing import ParamSpec, TypeVar
 
 import pytest
 
 _FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "openapi_specs"
+_FIXTURE_SUFFIXES = (".yaml", ".yml")
 _P = ParamSpec("_P")
 _R = TypeVar("_R")
 
@@ -18,10 +20,15 @@ def fixture_dir() -> Path:
     return _FIXTURE_DIR
 
 
-def iter_fixture_paths() -> list[Path]:
-    """Return all YAML fixture paths sorted by name."""
-    paths = sorted(_FIXTURE_DIR.glob("*.yaml")) + sorted(_FIXTURE_DIR.glob("*.yml"))
-    return [path for path in paths if path.is_file()]
+@cache
+def iter_fixture_paths() -> tuple[Path, ...]:
+    """Return all YAML fixture paths sorted by name, ``.yaml`` before ``.yml``."""
+    paths = [
+        path
+        for path in _FIXTURE_DIR.iterdir()
+        if path.suffix in _FIXTURE_SUFFIXES and path.is_file()
+    ]
+    return tuple(sorted(paths, key=lambda path: (_FIXTURE_SUFFIXES.index(path.suffix), path)))
 
 
 def parametrize_fixtures() -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
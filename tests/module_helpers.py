@@ -0,0 +1,44 @@
+"""Shared helpers for loading generated modules in tests."""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.util
+import sys
+from types import CodeType, ModuleType
+
+
+class _SourceStringLoader(importlib.abc.InspectLoader):
+    """Loader serving module source from memory instead of the file system."""
+
+    def __init__(self, source: str) -> None:
+        self._source = source
+
+    def get_source(self, fullname: str) -> str:
+        """Return the in-memory module source."""
+        return self._source
+
+    def get_code(self, fullname: str) -> CodeType:
+        """Compile the source, named after the module in tracebacks."""
+        return self.source_to_code(self._source, f"<{fullname}>")
+
+    def is_package(self, fullname: str) -> bool:
+        """Report that in-memory modules are never packages."""
+        return False
+
+
+def load_module_from_source(*, module_name: str, source: str) -> ModuleType:
+    """Load a module from in-memory source and register it in ``sys.modules``."""
+    loader = _SourceStringLoader(source)
+    spec = importlib.util.spec_from_loader(module_name, loader)
+    if spec is None:
+        raise RuntimeError(f"Unable to import module from source: {module_name}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        loader.exec_module(module)
+    except Exception:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
@@ -10,6 +10,7 @@ from openapi_python_client.schema import OpenAPI
 from pydantic import ValidationError
 
 from openapi_to_pydantic_generator.json_types import JSONObject, JSONValue
+from openapi_to_pydantic_generator.loader import YamlLoader
 from .fixture_helpers import fixture_dir, parametrize_fixtures
 
 FIXTURE_DIR = fixture_dir()
@@ -17,8 +18,8 @@ FIXTURE_DIR = fixture_dir()
 
 def _load_yaml(path: Path) -> JSONObject:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle)
+        with path.open("rb") as handle:
+            data = yaml.load(handle, Loader=YamlLoader)
     except yaml.YAMLError as exc:
         pytest.fail(f"Failed to parse YAML in {path}: {exc}")
     except OSError as exc:
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import ast
 import subprocess
-import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
+from click.testing import CliRunner
+from ruff.__main__ import find_ruff_bin
 
-from openapi_to_pydantic_generator.generator import WriteError, run_generation
+from openapi_to_pydantic_generator.cli import main
+from openapi_to_pydantic_generator.generator import GenerationRun, WriteError, run_generation
 from openapi_to_pydantic_generator.naming import path_to_endpoint_name
 from .fixture_helpers import iter_fixture_paths, parametrize_fixtures
 
@@ -117,6 +120,33 @@ def _assert_endpoint_docstring_matches_generated_modules(
                 assert class_name in endpoint_docstring
 
 
+@dataclass(frozen=True, slots=True)
+class _VerifiedGeneration:
+    fixture_path: Path
+    output_dir: Path
+    run: GenerationRun
+
+
+@pytest.fixture(
+    name="verified_generation",
+    scope="module",
+    params=iter_fixture_paths(),
+    ids=lambda path: path.name,
+)
+def fixture_verified_generation(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> _VerifiedGeneration:
+    """Generate and verify each fixture once for the tests that only read the result."""
+    fixture_path: Path = request.param
+    output_dir = tmp_path_factory.mktemp("generated") / fixture_path.stem
+    run = run_generation(
+        input_path=fixture_path,
+        output_dir=output_dir,
+        verify=True,
+    )
+    return _VerifiedGeneration(fixture_path=fixture_path, output_dir=output_dir, run=run)
+
+
 @parametrize_fixtures()
 def test_generation_smoke(fixture_path: Path, tmp_path: Path) -> None:
     """Each fixture should generate a models tree without crashing."""
@@ -129,18 +159,13 @@ def test_generation_smoke(fixture_path: Path, tmp_path: Path) -> None:
 
     assert Path(run.result.output_dir) == output_dir
     assert (output_dir / "models").is_dir()
+    assert run.verification_report is None
 
 
-@parametrize_fixtures()
-def test_generation_with_verification(fixture_path: Path, tmp_path: Path) -> None:
+def test_generation_with_verification(verified_generation: _VerifiedGeneration) -> None:
     """Verification should complete and return a report for known fixtures."""
-    output_dir = tmp_path / f"{fixture_path.stem}_verified"
-    run = run_generation(
-        input_path=fixture_path,
-        output_dir=output_dir,
-        verify=True,
-    )
-    report = run.verification_report
+    fixture_path = verified_generation.fixture_path
+    report = verified_generation.run.verification_report
     assert report is not None
     assert report.verified_count > 0
     if report.mismatch_count > 0:
@@ -199,18 +224,13 @@ def test_generation_invokes_ruff_formatting(
 
 def test_cli_help_screen() -> None:
     """Running the CLI help should succeed and print usage information."""
-    result = subprocess.run(
-        [sys.executable, "-m", "openapi_to_pydantic_generator", "--help"],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "usage:" in result.stdout.lower()
+    result = CliRunner().invoke(main, ["--help"], prog_name="openapi-to-pydantic-generator")
+    assert result.exit_code == 0, result.output
+    assert "usage:" in result.output.lower()
 
 
 def test_generated_modules_pass_ruff_check(tmp_path: Path) -> None:
-    """Generated modules should pass all ruff checks."""
+    """Generated modules should pass ruff checks and already be ruff-formatted."""
     fixture_path = iter_fixture_paths()[0]
     output_dir = tmp_path / "no_unused_imports"
     run_generation(
@@ -221,9 +241,7 @@ def test_generated_modules_pass_ruff_check(tmp_path: Path) -> None:
 
     lint = subprocess.run(
         [
-            sys.executable,
-            "-m",
-            "ruff",
+            find_ruff_bin(),
             "check",
             "--ignore",
             "D100,D101,D102,D103,D104,D205,D301,D415,E501",
@@ -236,6 +254,15 @@ def test_generated_modules_pass_ruff_check(tmp_path: Path) -> None:
     details = f"{lint.stdout}\n{lint.stderr}".strip()
     assert lint.returncode == 0, details
 
+    formatting = subprocess.run(
+        [find_ruff_bin(), "format", "--check", str(output_dir / "models")],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    details = f"{formatting.stdout}\n{formatting.stderr}".strip()
+    assert formatting.returncode == 0, details
+
 
 def test_generated_package_docstrings_include_navigation_context(tmp_path: Path) -> None:
     """Generated package docstrings should map URL patterns to modules and models."""
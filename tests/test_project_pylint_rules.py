@@ -2,27 +2,33 @@
 
 from __future__ import annotations
 
-import os
-import subprocess
-import sys
+from dataclasses import dataclass
+from io import StringIO
 from pathlib import Path
 
+from pylint.lint import Run
+from pylint.reporters.text import TextReporter
+
+
+@dataclass(frozen=True, slots=True)
+class _PylintResult:
+    returncode: int
+    output: str
+
 
 def _run_pylint_for_source(
     *,
     tmp_path: Path,
     source: str,
     enable: str,
-) -> subprocess.CompletedProcess[str]:
+) -> _PylintResult:
+    # Lint in-process: starting a fresh interpreter and importing pylint and astroid
+    # costs far more than checking a few lines.
     file_path = tmp_path / "lint_target.py"
     file_path.write_text(source, encoding="utf-8")
-    env = dict(os.environ)
-    env["PYTHONPATH"] = str(Path.cwd() / "src")
-    return subprocess.run(
+    output = StringIO()
+    run = Run(
         [
-            sys.executable,
-            "-m",
-            "pylint",
             str(file_path),
             "-rn",
             "-sn",
@@ -30,11 +36,10 @@ def _run_pylint_for_source(
             f"--enable={enable}",
             "--load-plugins=project_pylint_rules",
         ],
-        check=False,
-        capture_output=True,
-        text=True,
-        env=env,
+        reporter=TextReporter(output),
+        exit=False,
     )
+    return _PylintResult(returncode=run.linter.msg_status, output=output.getvalue())
 
 
 def test_prefer_union_rule_triggers_for_type_alias_pipe_union(tmp_path: Path) -> None:
@@ -48,7 +53,7 @@ def test_prefer_union_rule_triggers_for_type_alias_pipe_union(tmp_path: Path) ->
         ),
         enable="prefer-union",
     )
-    combined_output = f"{result.stdout}\n{result.stderr}"
+    combined_output = result.output
     assert result.returncode != 0, combined_output
     assert "prefer-union" in combined_output, combined_output
 
@@ -60,6 +65,6 @@ def test_prefer_optional_rule_triggers_for_pipe_none(tmp_path: Path) -> None:
         source=("from __future__ import annotations\nvalue: str | None = None\n"),
         enable="prefer-optional",
     )
-    combined_output = f"{result.stdout}\n{result.stderr}"
+    combined_output = result.output
     assert result.returncode != 0, combined_output
     assert "prefer-optional" in combined_output, combined_output
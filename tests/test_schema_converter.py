@@ -2,45 +2,29 @@
 
 from __future__ import annotations
 
+import ast
 import itertools
-import tempfile
-from pathlib import Path
 from typing import Optional, TypeGuard
 
 from pydantic import BaseModel, RootModel
 
 from openapi_to_pydantic_generator.codegen_ast import render_section_module
 from openapi_to_pydantic_generator.json_types import JSONObject, JSONValue, MutableJSONObject
-from openapi_to_pydantic_generator.module_loading import load_module_from_path
-from openapi_to_pydantic_generator.schema_to_models import SchemaConverter
+from openapi_to_pydantic_generator.schema_to_models import (
+    SchemaConverter,
+    sanitize_json_schema_extra,
+)
+from .module_helpers import load_module_from_source
 
 
 def _build_model_schema(*, schema: JSONObject, section_name: str = "body") -> MutableJSONObject:
-    converter = SchemaConverter("3.1.0")
-    section = converter.build_section_from_schema(
-        section_name=section_name,
-        root_class_name="Body",
-        schema=schema,
-    )
-    source = render_section_module(section)
-    with tempfile.TemporaryDirectory() as temp_dir:
-        module_path = Path(temp_dir) / "generated_section.py"
-        module_path.write_text(source, encoding="utf-8")
-        module_name = f"generated_test_{next(_COUNTER)}"
-        module = load_module_from_path(module_name=module_name, module_path=module_path)
-
-        value = getattr(module, section.root_class_name, None)
-        if not _is_base_model_type(value):
-            raise RuntimeError(
-                f"Generated class {section.root_class_name} missing in {module_path}"
-            )
-        value.model_rebuild(_types_namespace=module.__dict__)
-        schema_output_value: JSONValue = value.model_json_schema()
-        if not isinstance(schema_output_value, dict):
-            raise RuntimeError(
-                f"Generated model JSON schema must be a mapping, got {type(schema_output_value)!r}"
-            )
-        return schema_output_value
+    model_class = _build_model_class(schema=schema, section_name=section_name)
+    schema_output_value: JSONValue = model_class.model_json_schema()
+    if not isinstance(schema_output_value, dict):
+        raise RuntimeError(
+            f"Generated model JSON schema must be a mapping, got {type(schema_output_value)!r}"
+        )
+    return schema_output_value
 
 
 def _build_model_class(*, schema: JSONObject, section_name: str = "body") -> type[BaseModel]:
@@ -51,19 +35,14 @@ def _build_model_class(*, schema: JSONObject, section_name: str = "body") -> typ
         schema=schema,
     )
     source = render_section_module(section)
-    with tempfile.TemporaryDirectory() as temp_dir:
-        module_path = Path(temp_dir) / "generated_section.py"
-        module_path.write_text(source, encoding="utf-8")
-        module_name = f"generated_test_{next(_COUNTER)}"
-        module = load_module_from_path(module_name=module_name, module_path=module_path)
+    module_name = f"generated_test_{next(_COUNTER)}"
+    module = load_module_from_source(module_name=module_name, source=source)
 
-        value = getattr(module, section.root_class_name, None)
-        if not _is_base_model_type(value):
-            raise RuntimeError(
-                f"Generated class {section.root_class_name} missing in {module_path}"
-            )
-        value.model_rebuild(_types_namespace=module.__dict__)
-        return value
+    value = getattr(module, section.root_class_name, None)
+    if not _is_base_model_type(value):
+        raise RuntimeError(f"Generated class {section.root_class_name} missing in {module_name}")
+    value.model_rebuild(_types_namespace=module.__dict__)
+    return value
 
 
 def test_reserved_pydantic_member_names_are_rewritten() -> None:
@@ -155,7 +134,7 @@ def test_field_constraints_are_preserved_in_generated_schema() -> None:
     assert isinstance(properties, dict), f"Missing properties in schema: {generated!r}"
     limit = properties.get("limit")
     assert isinstance(limit, dict), f"Missing limit property in schema: {generated!r}"
-    assert limit.get("maximum") == 250, f"Expected maximum=250 for limit, got: {limit!r}"
+    assert {"type": "integer", "maximum": 250}.items() <= limit.items(), limit
 
 
 def test_generated_source_prefers_optional_over_pipe_none() -> None:
@@ -175,10 +154,162 @@ def test_generated_source_prefers_optional_over_pipe_none() -> None:
     )
     source = render_section_module(section)
     assert "| None" not in source
+    assert not any(
+        isinstance(node, ast.BinOp)
+        and isinstance(node.op, ast.BitOr)
+        and any(_is_none_constant(operand) for operand in (node.left, node.right))
+        for node in ast.walk(ast.parse(source))
+    )
+
+
+def test_statuses_with_identical_schemas_share_one_model() -> None:
+    """Statuses repeating an earlier schema reuse that status model in the root union."""
+    error_schema: JSONObject = {
+        "type": "object",
+        "properties": {"message": {"type": "string"}},
+    }
+    converter = SchemaConverter("3.1.0")
+    section = converter.build_section_from_status_map(
+        section_name="errors",
+        root_class_name="Errors",
+        schemas_by_status={
+            "401": error_schema,
+            "403": dict(error_schema),
+            "404": {"type": "string"},
+        },
+    )
+
+    model_names = [model.name for model in section.models]
+    assert "Errors403" not in model_names, f"Duplicate status model emitted: {model_names!r}"
+    assert "Errors401" in model_names
+    source = render_section_module(section)
+    assert "RootModel[Union[Errors401, Errors404]]" in source, source
+
+
+def test_statuses_sharing_one_schema_keep_union_root() -> None:
+    """Several statuses with one shared schema still produce a root model over the status."""
+    error_schema: JSONObject = {
+        "type": "object",
+        "properties": {"message": {"type": "string"}},
+    }
+    converter = SchemaConverter("3.1.0")
+    section = converter.build_section_from_status_map(
+        section_name="errors",
+        root_class_name="Errors",
+        schemas_by_status={"400": error_schema, "500": dict(error_schema)},
+    )
+
+    model_names = [model.name for model in section.models]
+    assert model_names == ["Errors400", "Errors"], model_names
+    source = render_section_module(section)
+    assert "class Errors(RootModel[Errors400])" in source, source
+
+
+def test_statuses_with_equal_comparing_enum_values_keep_separate_models() -> None:
+    """Enum values ``1`` and ``True`` compare equal but must not merge status models."""
+    converter = SchemaConverter("3.1.0")
+    section = converter.build_section_from_status_map(
+        section_name="response",
+        root_class_name="Response",
+        schemas_by_status={
+            "200": {"enum": [1]},
+            "201": {"enum": [True]},
+        },
+    )
+
+    source = render_section_module(section)
+    assert "Literal[1]" in source, source
+    assert "Literal[True]" in source, source
+    assert "RootModel[Union[Response200, Response201]]" in source, source
+
+
+def test_identical_nested_object_schemas_share_one_model() -> None:
+    """Repeated nested object shapes in a section are emitted as a single class."""
+    address: JSONObject = {
+        "type": "object",
+        "properties": {"street": {"type": "string"}},
+    }
+    converter = SchemaConverter("3.1.0")
+    section = converter.build_section_from_schema(
+        section_name="body",
+        root_class_name="Body",
+        schema={
+            "type": "object",
+            "properties": {
+                "billing": address,
+                "shipping": dict(address),
+                "legacy": {**address, "description": "Old address."},
+                "mailing": address,
+            },
+        },
+    )
+
+    # The shared class is named after the first property using the shape.
+    model_names = [model.name for model in section.models]
+    assert model_names == ["BodyBilling", "BodyLegacy", "Body"], model_names
+    assert "BodyShipping" not in model_names
+    assert "BodyMailing" not in model_names
+    root = section.models[-1]
+    annotations = {field_def.name: field_def.annotation for field_def in root.fields}
+    assert annotations["shipping"] == annotations["billing"] == "BodyBilling"
+    assert annotations["mailing"] == "BodyBilling"
+
+
+def test_converter_leaves_source_schema_untouched() -> None:
+    """Conversion works on shared source nodes, so it must never mutate them."""
+    schema: MutableJSONObject = {
+        "type": "object",
+        "properties": {
+            "tags": {"type": ["string"], "nullable": True},
+            "owner": {
+                "nullable": True,
+                "allOf": [
+                    {"type": "object", "properties": {"id": {"type": "integer"}}},
+                    {"type": "object", "properties": {"name": {"type": "string"}}},
+                ],
+            },
+            "items": {"type": "array", "items": {"type": "object", "properties": {}}},
+        },
+    }
+    snapshot = repr(schema)
+
+    SchemaConverter("3.0.3").build_section_from_schema(
+        section_name="body",
+        root_class_name="Body",
+        schema=schema,
+    )
+
+    assert repr(schema) == snapshot
+
+
+def test_sanitize_json_schema_extra_drops_nested_refs_without_aliasing() -> None:
+    """Nested `$ref` entries are dropped and the result shares no containers with the input."""
+    nested: MutableJSONObject = {"$ref": "#/components/schemas/Pet", "type": "object"}
+    payload: MutableJSONObject = {
+        "items": [nested, {"anyOf": [{"$ref": "#/x"}, {"type": "string"}]}],
+        "$ref": "#/top",
+        "x-vendor": {"depth": [[1, 2], {"$ref": "#/y", "keep": True}]},
+    }
+
+    sanitized = sanitize_json_schema_extra(payload)
+
+    assert sanitized == {
+        "items": [{"type": "object"}, {"anyOf": [{}, {"type": "string"}]}],
+        "x-vendor": {"depth": [[1, 2], {"keep": True}]},
+    }
+    assert isinstance(sanitized, dict)
+    items = sanitized["items"]
+    assert isinstance(items, list)
+    assert items[0] is not nested
+    assert nested == {"$ref": "#/components/schemas/Pet", "type": "object"}
 
 
 _COUNTER = itertools.count(1)
 
 
+def _is_none_constant(node: ast.expr) -> bool:
+    return isinstance(node, ast.Constant) and node.value is None
+
+
 def _is_base_model_type(value: Optional[type]) -> TypeGuard[type[BaseModel]]:
     return isinstance(value, type) and issubclass(value, BaseModel)